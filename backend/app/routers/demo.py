@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from ..database import get_db
 from ..models import DemoRequest
 from ..schemas import DemoRequestCreate, DemoRequestResponse, MessageResponse
@@ -20,20 +21,20 @@ async def create_demo_request(
     Create a new demo request from the landing page
     """
     try:
-        # Create new demo request
-        db_demo = DemoRequest(
-            name=demo_request.name,
-            email=demo_request.email,
-            company=demo_request.company,
-            role=demo_request.role,
-            message=demo_request.message,
-            status="new",
-            contacted=False
+        # Single INSERT; the response doesn't need the new row, so skip
+        # the ORM add/refresh round-trips
+        db.execute(
+            insert(DemoRequest).values(
+                name=demo_request.name,
+                email=demo_request.email,
+                company=demo_request.company,
+                role=demo_request.role,
+                message=demo_request.message,
+                status="new",
+                contacted=False
+            )
         )
-
-        db.add(db_demo)
         db.commit()
-        db.refresh(db_demo)
 
         return MessageResponse(
             message="Demo request submitted successfully! We'll be in touch within 24 hours.",
@@ -52,12 +53,19 @@ async def create_demo_request(
 async def get_demo_requests(
     skip: int = 0,
     limit: int = 100,
+    before_id: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get all demo requests (admin endpoint)
+    Get all demo requests, newest first (admin endpoint)
+
+    Pass the last id of a page as `before_id` to fetch the next one with an
+    index seek on the primary key instead of an OFFSET scan.
     """
-    requests = db.query(DemoRequest).offset(skip).limit(limit).all()
+    query = db.query(DemoRequest)
+    if before_id is not None:
+        query = query.filter(DemoRequest.id < before_id)
+    requests = query.order_by(DemoRequest.id.desc()).offset(skip).limit(limit).all()
     return requests
 
 
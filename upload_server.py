@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 """Simple file upload server for logo images."""
-import http.server, cgi, os, pathlib
+import gzip, http.server, io, os, pathlib, shutil
+from concurrent.futures import ThreadPoolExecutor
+from multipart.exceptions import FormParserError
+from multipart.multipart import Field, File, FormParser, parse_options_header
 
 UPLOAD_DIR = pathlib.Path("/home/user/Jaque-landing-page/assets/logos")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+UPLOAD_DIR_STR = os.path.join(UPLOAD_DIR, "")  # "<dir>/"; destinations are plain str
+COPY_BUFSIZE = 1 << 20  # stream uploads to disk in 1 MiB chunks
+MAX_BODY_SIZE = 10 << 20  # whole POST, i.e. ~2 MiB per logo
+BRANDS = (("dell", "Dell"), ("anthropic", "Anthropic"), ("uoft", "U of T"),
+          ("cornell", "Cornell"), ("tesla", "Tesla"))
+FIELDS = tuple(field for field, _ in BRANDS)
+FIELD_NAMES = frozenset(field.encode() for field in FIELDS)  # as the parser sees them
+ALLOWED_EXTS = frozenset({".png", ".jpg", ".jpeg", ".svg", ".webp"})
+SAVE_POOL = ThreadPoolExecutor(max_workers=len(FIELDS))  # one slot per logo field
 
 HTML = """<!DOCTYPE html>
 <html>
@@ -18,6 +30,7 @@ HTML = """<!DOCTYPE html>
   .slot input{display:none}
   .slot .name{font-weight:600;min-width:120px}
   .slot .chosen{font-size:12px;color:#6366f1;margin-top:4px}
+  .slot .pick{background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block}
   button{background:#6366f1;color:#fff;border:none;border-radius:8px;padding:14px 32px;font-size:15px;cursor:pointer;width:100%;margin-top:8px}
   button:hover{background:#4f46e5}
   .ok{color:#22c55e;font-weight:600;margin-top:20px;display:none}
@@ -27,89 +40,177 @@ HTML = """<!DOCTYPE html>
 <h2>Upload Logo Images</h2>
 <p>Select the logo file for each brand, then click Upload All.</p>
 <form method="POST" enctype="multipart/form-data">
-  <div class="slot">
-    <span class="name">1. Dell</span>
-    <label>
-      <input type="file" name="dell" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
-      <span style="background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block">Choose file</span>
-      <div class="chosen"></div>
-    </label>
-  </div>
-  <div class="slot">
-    <span class="name">2. Anthropic</span>
-    <label>
-      <input type="file" name="anthropic" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
-      <span style="background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block">Choose file</span>
-      <div class="chosen"></div>
-    </label>
-  </div>
-  <div class="slot">
-    <span class="name">3. U of T</span>
-    <label>
-      <input type="file" name="uoft" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
-      <span style="background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block">Choose file</span>
-      <div class="chosen"></div>
-    </label>
-  </div>
-  <div class="slot">
-    <span class="name">4. Cornell</span>
-    <label>
-      <input type="file" name="cornell" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
-      <span style="background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block">Choose file</span>
-      <div class="chosen"></div>
-    </label>
-  </div>
-  <div class="slot">
-    <span class="name">5. Tesla</span>
+{slots}  <button type="submit">Upload All</button>
+</form>
+</body>
+</html>
+"""
+
+SLOT = """  <div class="slot">
+    <span class="name">{n}. {label}</span>
     <label>
-      <input type="file" name="tesla" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
-      <span style="background:#1a1a2e;border:1px dashed #333;border-radius:6px;padding:8px 16px;display:inline-block">Choose file</span>
+      <input type="file" name="{field}" accept="image/*" onchange="this.nextElementSibling.textContent=this.files[0]?.name||''">
+      <span class="pick">Choose file</span>
       <div class="chosen"></div>
     </label>
   </div>
-  <button type="submit">Upload All</button>
-</form>
-</body>
-</html>
 """
 
 SUCCESS = """<!DOCTYPE html><html><head><meta charset="UTF-8"><title>Done</title>
-<style>body{{font-family:sans-serif;max-width:600px;margin:60px auto;background:#0a0a0a;color:#fff;padding:0 24px}}
-.ok{{color:#22c55e;font-size:18px;font-weight:600;margin-bottom:16px}}
-ul{{color:#aaa;font-size:14px;line-height:1.8}}
+<style>body{font-family:sans-serif;max-width:600px;margin:60px auto;background:#0a0a0a;color:#fff;padding:0 24px}
+.ok{color:#22c55e;font-size:18px;font-weight:600;margin-bottom:16px}
+ul{color:#aaa;font-size:14px;line-height:1.8}
 </style></head><body>
 <div class="ok">✓ Logos uploaded successfully</div>
 <ul>{files}</ul>
 <p style="color:#888;font-size:13px;margin-top:24px">You can close this tab. Claude Code will now update the website.</p>
 </body></html>"""
 
+# Encoded once at import; the handlers only write bytes
+HTML_BYTES = HTML.replace("{slots}", "".join(
+    SLOT.format(n=n, field=field, label=label)
+    for n, (field, label) in enumerate(BRANDS, 1))).encode()
+HTML_LENGTH = str(len(HTML_BYTES))
+HTML_GZIP = gzip.compress(HTML_BYTES, compresslevel=9)
+HTML_GZIP_LENGTH = str(len(HTML_GZIP))
+SUCCESS_PRE, SUCCESS_POST = (part.encode() for part in SUCCESS.split("{files}"))
+
+def save_upload(src, dest):
+    """Copy an uploaded part to dest; use sendfile when it was spilled to a temp file."""
+    with open(dest, "wb") as out:
+        try:
+            fd = src.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            fd = None
+        if fd is not None and hasattr(os, "sendfile"):
+            src.flush()
+            size, offset = os.fstat(fd).st_size, 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(out.fileno(), fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Filesystem doesn't support it; redo the copy in userspace
+                out.seek(0)
+                out.truncate()
+        src.seek(0)
+        shutil.copyfileobj(src, out, COPY_BUFSIZE)
+
+class LogoFile(File):
+    """File part that only spools the logo fields; other parts are read past."""
+    def on_data(self, data):
+        if self.field_name not in FIELD_NAMES:
+            return len(data)
+        return super().on_data(data)
+
+class SkippedField(Field):
+    """The form has no plain fields we use, so don't buffer their values."""
+    def on_data(self, data):
+        return len(data)
+
+def accepts_gzip(accept_encoding):
+    """True if the Accept-Encoding header lists gzip without refusing it (q=0)."""
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            params = params.replace(" ", "")
+            if not params.startswith("q="):
+                return True
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
 class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive; every response sends Content-Length
     def log_message(self, *a): pass
+    log_request = log_error = log_message  # no-op directly, skip the base-class hop
 
     def do_GET(self):
+        gzipped = accepts_gzip(self.headers.get("Accept-Encoding", ""))
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", HTML_GZIP_LENGTH)
+        else:
+            self.send_header("Content-Length", HTML_LENGTH)
         self.end_headers()
-        self.wfile.write(HTML.encode())
+        self.wfile.write(HTML_GZIP if gzipped else HTML_BYTES)
 
     def do_POST(self):
-        form = cgi.FieldStorage(fp=self.rfile, headers=self.headers,
-                                environ={"REQUEST_METHOD": "POST",
-                                         "CONTENT_TYPE": self.headers["Content-Type"]})
-        saved = []
-        for field in ["dell", "anthropic", "uoft", "cornell", "tesla"]:
-            item = form[field] if field in form else None
-            if item and item.filename:
-                ext = os.path.splitext(item.filename)[1].lower() or ".png"
-                dest = UPLOAD_DIR / f"{field}{ext}"
-                dest.write_bytes(item.file.read())
+        # Refuse before touching the body; send_error also closes the connection
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self.send_error(411, "Content-Length required")
+            return
+        if length > MAX_BODY_SIZE:
+            self.send_error(413, "Upload too large")
+            return
+        # Streaming parse: logo parts over 1 MiB spill to temp files as they
+        # arrive, anything else is discarded without being buffered
+        form = {}
+        def on_file(f):
+            if f.field_name in FIELD_NAMES:
+                previous = form.pop(f.field_name.decode(), None)
+                if previous is not None:
+                    previous.close()
+                form[f.field_name.decode()] = f
+        content_type, params = parse_options_header(self.headers.get("Content-Type", ""))
+        try:
+            parser = FormParser(content_type.decode("latin-1"), None, on_file,
+                                boundary=params.get(b"boundary"),
+                                FileClass=LogoFile, FieldClass=SkippedField)
+            remaining = length
+            while remaining:
+                chunk = self.rfile.read(min(remaining, COPY_BUFSIZE))
+                if not chunk:
+                    break
+                parser.write(chunk)
+                remaining -= len(chunk)
+            parser.finalize()
+        except (ValueError, FormParserError):
+            for item in form.values():
+                item.close()
+            self.send_error(400, "Malformed upload")
+            return
+        saved, sources, dests = [], [], []
+        for field in FIELDS:
+            item = form.get(field)
+            if item is not None and item.file_name:
+                filename = item.file_name.decode("utf-8", "replace")
+                dot = filename.rfind(".")
+                ext = filename[dot:].lower() if dot >= 0 else ".png"
+                if ext not in ALLOWED_EXTS:
+                    saved.append(f"<li>{field} — skipped, unsupported file type</li>")
+                    continue
+                sources.append(item.file_object)
+                dests.append(UPLOAD_DIR_STR + field + ext)
                 saved.append(f"<li>{field}{ext} — saved</li>")
+        try:
+            # The parts are independent files; write them concurrently
+            list(SAVE_POOL.map(save_upload, sources, dests))
+        finally:
+            for item in form.values():
+                item.close()
+        files = ("".join(saved) or "<li>No files selected</li>").encode()
+        body = b"".join((SUCCESS_PRE, files, SUCCESS_POST))
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(SUCCESS.format(files="".join(saved) or "<li>No files selected</li>").encode())
+        self.wfile.write(body)
 
 if __name__ == "__main__":
-    server = http.server.HTTPServer(("0.0.0.0", 3000), Handler)
+    # One thread per connection so a slow uploader doesn't stall everyone else
+    server = http.server.ThreadingHTTPServer(("0.0.0.0", 3000), Handler)
     print("Upload server running on port 3000", flush=True)
     server.serve_forever()